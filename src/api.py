@@ -1,16 +1,25 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from typing import Optional
 import joblib
 import pandas as pd
 import numpy as np
 
+from tracing import Tracer
+
 app = FastAPI(
     title="AI Hiring Fairness Evaluation API",
     description="Predict hiring decisions with/without fairness mitigation.",
     version="1.0.0"
 )
 
+# Enabled with SCREENING_TRACING=1; otherwise spans/counters are no-ops
+tracer = Tracer()
+tracer.declare("predictions", "Predictions served, by model.",
+               labels=[{"model": "original"}, {"model": "mitigated"}])
+tracer.declare("prediction_errors", "Predictions that failed with an error.")
+
 # ---------------------------
 # Load models & preprocessor
 # ---------------------------
@@ -43,6 +52,7 @@ class CandidateInput(BaseModel):
     JobSatisfaction: float
     MaritalStatus: str
     MonthlyIncome: float
+    MonthlyRate: float
     NumCompaniesWorked: float
     OverTime: str
     PercentSalaryHike: float
@@ -58,3 +68,41 @@ class CandidateInput(BaseModel):
     YearsWithCurrManager: float
 
     mitigate: Optional[bool] = False
+
+
+# ---------------------------
+# Prediction Endpoint
+# ---------------------------
+@app.post("/predict")
+def predict(candidate: CandidateInput):
+    features = candidate.dict()
+    mitigate = features.pop("mitigate")
+
+    # Single-row frame with the same columns the pipelines were trained on
+    X = pd.DataFrame([features])
+    model = model_mit if mitigate else model_orig
+
+    try:
+        with tracer.span("predict"):
+            proba = float(model.predict_proba(X)[0][1])
+    except Exception as e:
+        tracer.incr("prediction_errors")
+        raise HTTPException(status_code=500, detail=f"Prediction failed: {e}")
+
+    tracer.incr("predictions", labels={"model": "mitigated" if mitigate else "original"})
+    return {
+        "hired": int(proba >= 0.5),
+        "probability": round(proba, 4),
+        "model": "mitigated" if mitigate else "original"
+    }
+
+
+# ---------------------------
+# Metrics Endpoint (Prometheus)
+# ---------------------------
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    if not tracer.enabled:
+        raise HTTPException(status_code=404, detail="Tracing disabled. Set SCREENING_TRACING=1 to expose metrics.")
+
+    return PlainTextResponse(tracer.render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -7,6 +7,7 @@ import re
 # Assuming these files are in the same directory
 from utils import extract_text, compute_similarity, detect_gender, get_embeddings, extract_experience 
 from eval_fairness import evaluate_fairness
+from tracing import Tracer
 
 # ================================
 # 🔧 Streamlit App Configuration
@@ -28,6 +29,8 @@ if 'results_df' not in st.session_state:
     st.session_state.results_df = pd.DataFrame(columns=["rank", "CANDIDATE NAME", "SCORE (RELEVANCE)", "EXPERIENCE", "ACTION", "gender"])
 if 'fairness_metrics' not in st.session_state:
      st.session_state.fairness_metrics = {'dir_base': 0.0, 'dir_mit': 0.0, 'eod': 0.0}
+# Per-rerun tracer (enabled with SCREENING_TRACING=1); spans are no-ops otherwise
+run_tracer = Tracer()
 
 # Load metrics from state to persist across reruns
 dir_baseline_val = st.session_state.fairness_metrics['dir_base']
@@ -57,7 +60,8 @@ with col_input:
     jd_final_text = jd_text
     if uploaded_jd:
         try:
-            jd_final_text = extract_text(uploaded_jd)
+            with run_tracer.span("extract"):
+                jd_final_text = extract_text(uploaded_jd)
         except Exception as e:
             st.error(f"Error processing JD file: {e}")
             jd_final_text = jd_text
@@ -98,7 +102,8 @@ if show_results:
     with st.spinner("Screening candidates and evaluating fairness..."):
         
         try:
-            jd_vec = get_embeddings(jd_final_text)
+            with run_tracer.span("encode"):
+                jd_vec = get_embeddings(jd_final_text)
         except Exception as e:
             st.error(f"Error generating JD embeddings: {e}")
             jd_vec = None
@@ -107,11 +112,14 @@ if show_results:
             rows = []
             for file in resume_files:
                 try:
-                    resume_text = extract_text(file)
-                    resume_vec = get_embeddings(resume_text)
+                    with run_tracer.span("extract"):
+                        resume_text = extract_text(file)
+                    with run_tracer.span("encode"):
+                        resume_vec = get_embeddings(resume_text)
                     
                     # Compute Similarity Score
-                    score = compute_similarity(jd_vec, resume_vec)
+                    with run_tracer.span("score"):
+                        score = compute_similarity(jd_vec, resume_vec)
                     
                     # Use the extract_experience function
                     experience = extract_experience(resume_text)
@@ -125,9 +133,11 @@ if show_results:
                     candidate_name = file.name.split('.')[0] 
 
                     rows.append([candidate_name, score, gender, f"{experience} Years"])
+                    run_tracer.incr("resumes_processed")
 
                 except Exception as e:
                     rows.append([file.name.split('.')[0], 0.0, "Unknown", "N/A"])
+                    run_tracer.incr("resumes_failed")
             
             if rows:
                 results_df = pd.DataFrame(rows, columns=["CANDIDATE NAME", "SCORE (RELEVANCE)", "gender", "EXPERIENCE"])
@@ -142,7 +152,8 @@ if show_results:
                     fairness_df = results_df[["gender", "SCORE (RELEVANCE)"]].rename(columns={"SCORE (RELEVANCE)": "score"})
                     
                     # FIX: Capture the calculated values
-                    dir_baseline_val, dir_mitigated_val, eod_val = evaluate_fairness(fairness_df)
+                    with run_tracer.span("fairness"):
+                        dir_baseline_val, dir_mitigated_val, eod_val = evaluate_fairness(fairness_df)
                     
                     # FIX: Save the calculated values to session state
                     st.session_state.fairness_metrics = {
@@ -274,4 +285,27 @@ if show_results and not st.session_state.results_df.empty:
             
             # ACTION Button (now the 6th column, index 5)
             if cols[5].button('Explain Rank (XAI)', key=f"xai_btn_{index}", use_container_width=True):
-                st.info(f"XAI Explanation requested for **{row['CANDIDATE NAME']}** (Score: {row['SCORE (RELEVANCE)']:.2f}).")
\ No newline at end of file
+                st.info(f"XAI Explanation requested for **{row['CANDIDATE NAME']}** (Score: {row['SCORE (RELEVANCE)']:.2f}).")
+
+        # ------------------------------------------
+        # 4.3 Timing Breakdown (only when tracing is enabled)
+        # ------------------------------------------
+        # Results are recomputed on every rerun, so this rerun's tracer holds the timings
+        timing_rows = run_tracer.breakdown()
+        if run_tracer.enabled and timing_rows:
+            st.markdown("---")
+            st.header("Timing Breakdown")
+
+            timing_df = pd.DataFrame(timing_rows)
+            timing_df["share"] = (timing_df["share"] * 100).round(1)
+            timing_df = timing_df.rename(columns={
+                "stage": "STAGE", "calls": "CALLS", "total_s": "TOTAL (s)",
+                "mean_ms": "MEAN (ms)", "max_ms": "MAX (ms)", "share": "SHARE (%)"
+            })
+            st.dataframe(timing_df, hide_index=True, use_container_width=True)
+
+            counters = run_tracer.counters()
+            st.caption(
+                f"Resumes processed: {counters.get('resumes_processed', 0)} | "
+                f"Failed: {counters.get('resumes_failed', 0)}"
+            )
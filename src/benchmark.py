@@ -0,0 +1,572 @@
+# benchmark.py
+"""
+End-to-end performance benchmark for the screening pipeline.
+
+Generates a synthetic resume corpus (PDF / DOCX / TXT) and synthetic HR-schema
+rows, then times every stage separately:
+    extract_text, get_embeddings, compute_similarity, extract_experience,
+    detect_gender, evaluate_fairness and the FastAPI /predict scoring path.
+
+For each stage and scale it reports throughput, latency percentiles, peak
+Python heap (tracemalloc) and peak process RSS, which also covers native
+memory such as PyMuPDF buffers and torch tensors, and compares the results
+against a stored baseline.
+
+Run from the src/ directory (like train_model.py):
+    python benchmark.py --stub-model --scales 10,100
+    python benchmark.py --stub-model --save-baseline
+"""
+import argparse
+import io
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+import zipfile
+import zlib
+from unittest import mock
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource  # POSIX only; RSS columns are left empty on Windows
+except ImportError:
+    resource = None
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+HR_DATA_PATH = "../data/HR-Employee.csv"
+# One baseline per embedding model, e.g. ../benchmarks/baseline.stub.json
+DEFAULT_BASELINE = "../benchmarks/baseline.{model}.json"
+
+# Run settings that must match the baseline for timings to be comparable
+COMPARABLE_CONFIG = ("model", "repeat", "seed")
+
+
+# ==========================================
+# 🧪 Stub Embedding Model
+# ==========================================
+class StubSentenceModel:
+    """
+    Deterministic, download-free stand-in for SentenceTransformer.
+    Hashes tokens into a fixed-size bag-of-words vector so similarity scores
+    still vary between resumes.
+    """
+
+    def __init__(self, *args, dim=384, **kwargs):
+        self.dim = dim
+
+    def encode(self, text, convert_to_tensor=False, **kwargs):
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for token in re.findall(r"[a-z0-9]+", text.lower()):
+            # crc32 rather than hash(): stable across processes, so runs stay comparable
+            vec[zlib.crc32(token.encode()) % self.dim] += 1.0
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+
+def load_utils(stub_model):
+    """
+    Imports utils.py with the requested embedding model.
+    Outside `streamlit run` utils cannot keep the model in session state, so the
+    SentenceTransformer constructor is pinned to a single instance while utils is
+    imported (patch is undone afterwards) and assigned to utils.model directly.
+    """
+    import sentence_transformers
+
+    model_cls = StubSentenceModel if stub_model else sentence_transformers.SentenceTransformer
+    instance = model_cls(MODEL_NAME)
+
+    with mock.patch("sentence_transformers.SentenceTransformer", return_value=instance):
+        import utils
+    utils.model = instance
+    return utils
+
+
+# ==========================================
+# 📄 Synthetic Resume Corpus
+# ==========================================
+SKILLS = [
+    "python", "sql", "machine learning", "data analysis", "tensorflow", "pytorch",
+    "project management", "stakeholder communication", "aws", "docker",
+    "statistics", "tableau", "excel", "java", "recruiting", "payroll",
+    "sales forecasting", "customer success", "agile", "nlp"
+]
+
+JOB_DESCRIPTION = (
+    "We are hiring a Data Scientist with 5 years of experience in python, sql, "
+    "machine learning and statistics. Experience with aws, docker and nlp is a plus. "
+    "Strong stakeholder communication and data analysis skills are required."
+)
+
+
+class UploadedFile(io.BytesIO):
+    """Minimal stand-in for Streamlit's UploadedFile (name + file-like API)."""
+
+    def __init__(self, name, data):
+        super().__init__(data)
+        self.name = name
+
+
+def make_resume_text(rng, female_names, male_names, paragraphs):
+    pool = rng.choice([female_names, male_names, ["jordan", "taylor", "casey"]])
+    first_name = rng.choice(pool).capitalize()
+    years = rng.randint(1, 20)
+
+    lines = [
+        f"{first_name} Doe",
+        f"{first_name.lower()}.doe@example.com",
+        "",
+        "SUMMARY",
+        f"Professional with {years} years of experience in {', '.join(rng.sample(SKILLS, 3))}.",
+        "",
+        "EXPERIENCE",
+    ]
+    for _ in range(paragraphs):
+        lines.append(
+            f"- Delivered projects using {', '.join(rng.sample(SKILLS, 4))} "
+            f"for {rng.randint(2, 50)} internal teams and clients."
+        )
+    lines += ["", "SKILLS", ", ".join(rng.sample(SKILLS, 8))]
+    return "\n".join(lines)
+
+
+def make_pdf(text):
+    import fitz  # PyMuPDF
+
+    lines = text.split("\n")
+    per_page = 50
+    with fitz.open() as pdf:
+        for start in range(0, len(lines), per_page):
+            page = pdf.new_page()
+            page.insert_text((50, 60), "\n".join(lines[start:start + per_page]), fontsize=10)
+        return pdf.tobytes()
+
+
+def make_docx(text):
+    # Smallest package docx2txt can read: content types, rels and the document body
+    paragraphs = "".join(
+        f"<w:p><w:r><w:t xml:space=\"preserve\">{escape(line)}</w:t></w:r></w:p>"
+        for line in text.split("\n")
+    )
+    document = (
+        "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+        "<w:document xmlns:w=\"http://schemas.openxmlformats.org/wordprocessingml/2006/main\">"
+        f"<w:body>{paragraphs}</w:body></w:document>"
+    )
+    content_types = (
+        "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+        "<Types xmlns=\"http://schemas.openxmlformats.org/package/2006/content-types\">"
+        "<Default Extension=\"rels\" ContentType=\"application/vnd.openxmlformats-package.relationships+xml\"/>"
+        "<Default Extension=\"xml\" ContentType=\"application/xml\"/>"
+        "<Override PartName=\"/word/document.xml\" "
+        "ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>"
+        "</Types>"
+    )
+    rels = (
+        "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+        "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+        "<Relationship Id=\"rId1\" "
+        "Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument\" "
+        "Target=\"word/document.xml\"/>"
+        "</Relationships>"
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", content_types)
+        docx.writestr("_rels/.rels", rels)
+        docx.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def make_resume_corpus(n, utils, seed=42, paragraphs=12):
+    """Returns n UploadedFile objects, cycling through PDF, DOCX and TXT."""
+    rng = random.Random(seed)
+    female_names = sorted(utils.FEMALE_NAMES)
+    male_names = sorted(utils.MALE_NAMES)
+
+    files = []
+    for i in range(n):
+        text = make_resume_text(rng, female_names, male_names, paragraphs)
+        ext = ("pdf", "docx", "txt")[i % 3]
+        if ext == "pdf":
+            data = make_pdf(text)
+        elif ext == "docx":
+            data = make_docx(text)
+        else:
+            data = text.encode("utf-8")
+        files.append(UploadedFile(f"candidate_{i:05d}.{ext}", data))
+    return files
+
+
+# ==========================================
+# 🧾 Synthetic HR-Schema Rows
+# ==========================================
+def make_hr_rows(n, field_names, seed=42):
+    """
+    Samples every CandidateInput field independently from the HR CSV, so rows
+    follow realistic per-column distributions without copying real employees.
+    """
+    source = pd.read_csv(HR_DATA_PATH, encoding="utf-8-sig")
+    rng = np.random.default_rng(seed)
+
+    columns = {}
+    for name in field_names:
+        values = source[name].to_numpy()
+        # tolist() gives plain Python scalars, which pydantic validates like JSON input
+        columns[name] = values[rng.integers(0, len(values), size=n)].tolist()
+
+    rows = []
+    for i in range(n):
+        row = {name: columns[name][i] for name in field_names}
+        row["mitigate"] = bool(i % 2)
+        rows.append(row)
+    return rows
+
+
+def make_fairness_frame(n, seed=42):
+    """
+    Ranked-set stand-in for evaluate_fairness that always passes its guards
+    (>= 5 Male/Female rows, both genders, scores on both sides of 0.5), so the
+    stage times the AIF360 metrics rather than an early ValueError.
+    """
+    n = max(n, 10)
+    rng = np.random.default_rng(seed)
+    scores = rng.uniform(0.0, 1.0, size=n)
+    # Pin one favourable and one unfavourable score per gender
+    scores[:4] = [0.9, 0.8, 0.2, 0.1]
+    return pd.DataFrame({
+        "gender": ["Male" if i % 2 == 0 else "Female" for i in range(n)],
+        "score": scores,
+    })
+
+
+# ==========================================
+# ⏱️ Measurement Helpers
+# ==========================================
+def time_calls(fn, items):
+    """Calls fn once per item; returns (per-call latencies in seconds, wall time)."""
+    latencies = []
+    wall_start = time.perf_counter()
+    for item in items:
+        start = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - start)
+    return latencies, time.perf_counter() - wall_start
+
+
+def peak_rss_bytes():
+    """Process-lifetime peak resident set size, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def peak_memory(fn, items):
+    """Peak Python heap (bytes) while running fn over items, traced separately from timing."""
+    tracemalloc.start()
+    try:
+        for item in items:
+            fn(item)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _mb(num_bytes):
+    return num_bytes / (1024 * 1024) if num_bytes is not None else None
+
+
+def summarize(latencies, wall, heap_bytes, rss_before, rss_after):
+    ms = np.array(latencies) * 1000.0
+    rss_growth = rss_after - rss_before if rss_after is not None else None
+    return {
+        "calls": len(latencies),
+        "throughput_per_s": len(latencies) / wall if wall > 0 else 0.0,
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p90_ms": float(np.percentile(ms, 90)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+        "peak_heap_mb": _mb(heap_bytes),
+        # RSS is a process high-water mark: peak_rss_mb is the peak so far,
+        # rss_growth_mb is how far this stage pushed it up
+        "peak_rss_mb": _mb(rss_after),
+        "rss_growth_mb": _mb(rss_growth),
+    }
+
+
+def run_stage(fn, items, measure_memory):
+    # RSS is read around the timing pass, where tracemalloc is not running
+    rss_before = peak_rss_bytes()
+    latencies, wall = time_calls(fn, items)
+    rss_after = peak_rss_bytes()
+    heap = peak_memory(fn, items) if measure_memory else None
+    return summarize(latencies, wall, heap, rss_before, rss_after)
+
+
+# ==========================================
+# 🚀 Benchmark Runner
+# ==========================================
+def run_scale(scale, utils, api, client, args):
+    from eval_fairness import evaluate_fairness
+
+    results = {}
+    files = make_resume_corpus(scale, utils, seed=args.seed)
+
+    results["extract_text"] = run_stage(utils.extract_text, files, args.memory)
+    texts = [utils.extract_text(f) for f in files]
+
+    results["get_embeddings"] = run_stage(utils.get_embeddings, texts, args.memory)
+    jd_vec = utils.get_embeddings(JOB_DESCRIPTION)
+    vectors = [utils.get_embeddings(t) for t in texts]
+
+    results["compute_similarity"] = run_stage(
+        lambda vec: utils.compute_similarity(jd_vec, vec), vectors, args.memory
+    )
+    results["extract_experience"] = run_stage(utils.extract_experience, texts, args.memory)
+    results["detect_gender"] = run_stage(utils.detect_gender, texts, args.memory)
+
+    # evaluate_fairness works on the whole ranked set, so it is timed per call on
+    # the full frame and repeated to get a latency distribution. The corpus scores
+    # (especially with --stub-model) can all fall below 0.5, which would only time
+    # the early-exit guard, so a controlled frame of the same size is used instead.
+    # Any ValueError here is a real failure and is left to propagate.
+    fairness_df = make_fairness_frame(scale, seed=args.seed)
+    results["evaluate_fairness"] = run_stage(
+        lambda _: evaluate_fairness(fairness_df), range(args.repeat), args.memory
+    )
+
+    if api is not None:
+        field_names = [f for f in api.CandidateInput.__fields__ if f != "mitigate"]
+        rows = make_hr_rows(scale, field_names, seed=args.seed)
+        results["api_predict"] = run_stage(
+            lambda row: post_predict(client, row), rows, args.memory
+        )
+
+    return results
+
+
+def post_predict(client, row):
+    # Full HTTP path: routing, JSON parsing/validation and response serialization
+    response = client.post("/predict", json=row)
+    if response.status_code != 200:
+        raise RuntimeError(f"/predict returned {response.status_code}: {response.text}")
+    return response.json()
+
+
+def load_api(skip):
+    """Returns (api module, TestClient), or (None, None) when the stage is skipped."""
+    if skip:
+        return None, None
+    try:
+        import api
+        # TestClient needs httpx in addition to fastapi
+        from fastapi.testclient import TestClient
+    except (ImportError, RuntimeError) as e:
+        print(f"Skipping api_predict stage: {e}")
+        return None, None
+
+    return api, TestClient(api.app)
+
+
+# ==========================================
+# 📊 Reporting & Baseline Comparison
+# ==========================================
+def print_report(report):
+    header = (
+        f"{'STAGE':<20}{'SCALE':>7}{'CALLS':>7}{'CALLS/S':>12}{'P50 ms':>10}{'P90 ms':>10}{'P99 ms':>10}"
+        f"{'PY HEAP MB':>12}{'RSS MB':>10}{'RSS +MB':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    def fmt(value):
+        return f"{value:.2f}" if value is not None else "-"
+
+    for key, stats in report["results"].items():
+        stage, scale = key.split("@")
+        print(
+            f"{stage:<20}{scale:>7}{stats['calls']:>7}{stats['throughput_per_s']:>12.1f}"
+            f"{stats['p50_ms']:>10.3f}{stats['p90_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+            f"{fmt(stats['peak_heap_mb']):>12}{fmt(stats['peak_rss_mb']):>10}{fmt(stats['rss_growth_mb']):>10}"
+        )
+    print("CALLS/S = one resume / HR row per call, except evaluate_fairness "
+          "(one call scores the whole frame of max(SCALE, 10) rows).")
+    print("PY HEAP = tracemalloc peak (Python allocations only); "
+          "RSS = process peak resident memory, RSS + = growth during the stage.")
+
+
+def compare_to_baseline(report, baseline, tolerance, min_delta_ms, min_delta_mb):
+    """
+    Flags a regression for the same stage@scale when, compared to the baseline,
+      - p50 latency grows,
+      - throughput drops (compared as mean time per item), or
+      - peak Python heap grows
+    by more than `tolerance` (fraction) AND by more than an absolute floor
+    (`min_delta_ms` for time, `min_delta_mb` for memory). The floor keeps
+    microsecond stages from failing on ordinary timer jitter.
+    RSS is reported but not gated: it is a process-wide high-water mark.
+
+    A stage@scale present in the baseline but missing from this run (e.g.
+    api_predict skipped because httpx or the models are unavailable) also counts
+    as a failure, so a skipped stage cannot pass silently.
+    """
+    regressions = []
+    for key in baseline["results"]:
+        if key not in report["results"]:
+            print(f"{key:<28}{'-':<13}{'missing from this run':>30} MISSING")
+            regressions.append((key, "missing", None))
+
+    for key, stats in report["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+
+        # (metric, previous, current, cost now, cost before, absolute floor);
+        # "cost" is the higher-is-worse form of the metric
+        checks = [("p50_ms", base["p50_ms"], stats["p50_ms"], stats["p50_ms"], base["p50_ms"], min_delta_ms)]
+        if stats["throughput_per_s"] > 0 and base["throughput_per_s"] > 0:
+            checks.append((
+                "throughput", base["throughput_per_s"], stats["throughput_per_s"],
+                1000.0 / stats["throughput_per_s"], 1000.0 / base["throughput_per_s"], min_delta_ms
+            ))
+        if stats["peak_heap_mb"] is not None and base.get("peak_heap_mb") is not None:
+            checks.append((
+                "peak_heap_mb", base["peak_heap_mb"], stats["peak_heap_mb"],
+                stats["peak_heap_mb"], base["peak_heap_mb"], min_delta_mb
+            ))
+
+        for metric, previous, current, cost_now, cost_before, floor in checks:
+            change = (cost_now - cost_before) / cost_before if cost_before > 0 else 0.0
+            regressed = change > tolerance and (cost_now - cost_before) > floor
+            status = "REGRESSION" if regressed else "ok"
+            print(f"{key:<28}{metric:<13}{previous:>12.3f} -> {current:>12.3f} ({change:+.1%} cost) {status}")
+            if regressed:
+                regressions.append((key, metric, change))
+    return regressions
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
+
+
+def scale_list(value):
+    try:
+        scales = [positive_int(s) for s in value.split(",") if s.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got {value!r}")
+    if not scales:
+        raise argparse.ArgumentTypeError("at least one scale is required")
+    return scales
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume screening pipeline.")
+    parser.add_argument("--scales", type=scale_list, default="10,100",
+                        help="Comma-separated corpus sizes (resumes and HR rows per run).")
+    parser.add_argument("--stub-model", action="store_true",
+                        help="Use a local hashing embedder instead of downloading SBERT.")
+    parser.add_argument("--repeat", type=positive_int, default=5,
+                        help="Calls per scale for whole-set stages (evaluate_fairness).")
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="Skip the tracemalloc pass for peak Python heap (RSS is always recorded).")
+    parser.add_argument("--skip-api", action="store_true",
+                        help="Skip the FastAPI scoring stage (needs trained models in ../models).")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this path.")
+    parser.add_argument("--baseline",
+                        help="Baseline JSON to compare against "
+                             "(default: ../benchmarks/baseline.<model>.json, one per model).")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative slowdown before a stage counts as a regression.")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05,
+                        help="Ignore latency/throughput changes smaller than this per call (ms).")
+    parser.add_argument("--min-delta-mb", type=float, default=1.0,
+                        help="Ignore Python heap changes smaller than this (MB).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scales = args.scales
+
+    utils = load_utils(args.stub_model)
+    api, client = load_api(args.skip_api)
+
+    model = "stub" if args.stub_model else MODEL_NAME
+    baseline_path = args.baseline or DEFAULT_BASELINE.format(model=model)
+
+    report = {
+        "config": {
+            "scales": scales,
+            "model": model,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    for scale in scales:
+        print(f"Running scale={scale}...")
+        for stage, stats in run_scale(scale, utils, api, client, args).items():
+            report["results"][f"{stage}@{scale}"] = stats
+
+    print()
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path) or ".", exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {baseline_path}")
+        return 0
+
+    if not os.path.exists(baseline_path):
+        print(f"\nNo baseline at {baseline_path}; run with --save-baseline to create one.")
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    mismatched = [
+        f"{name}: baseline={baseline['config'].get(name)!r}, this run={report['config'][name]!r}"
+        for name in COMPARABLE_CONFIG
+        if baseline["config"].get(name) != report["config"][name]
+    ]
+    if mismatched:
+        print(f"\nRefusing to compare against {baseline_path}; run settings differ:")
+        for line in mismatched:
+            print(f"  {line}")
+        print("Re-run with matching settings, or use --save-baseline to record a new baseline.")
+        return 2
+
+    print(f"\nComparison against {baseline_path} (tolerance {args.tolerance:.0%}, "
+          f"floors {args.min_delta_ms} ms / {args.min_delta_mb} MB):")
+    regressions = compare_to_baseline(
+        report, baseline, args.tolerance, args.min_delta_ms, args.min_delta_mb
+    )
+    if regressions:
+        missing = sum(1 for _, metric, _ in regressions if metric == "missing")
+        print(f"\n{len(regressions) - missing} regression(s) and {missing} missing stage(s) detected.")
+        return 1
+    print("\nNo regressions detected.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
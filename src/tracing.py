@@ -0,0 +1,195 @@
+# tracing.py
+"""
+Lightweight per-stage tracing for the screening app and the API.
+
+Usage:
+    tracer = Tracer()
+    with tracer.span("encode"):
+        vec = get_embeddings(text)
+    tracer.incr("resumes_processed")
+    tracer.incr("predictions", labels={"model": "original"})
+
+Counters can be declared up front with HELP text (and known label sets), so
+they are exported at 0 from the first scrape:
+    tracer.declare("predictions", "Predictions served.", labels=[{"model": "original"}])
+
+Tracing is off unless the SCREENING_TRACING environment variable is set to
+1 / true / yes. When off, span() hands back a shared no-op context manager
+and incr() returns immediately, so instrumented code pays almost nothing.
+"""
+import os
+import re
+import threading
+import time
+from contextlib import nullcontext
+
+ENV_FLAG = "SCREENING_TRACING"
+
+# Histogram buckets (seconds) for the Prometheus export
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NOOP_SPAN = nullcontext()
+
+
+def tracing_enabled():
+    return os.environ.get(ENV_FLAG, "").strip().lower() in ("1", "true", "yes")
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Tracer:
+    """Collects timing spans and counters. Safe to share between threads."""
+
+    def __init__(self, enabled=None):
+        self.enabled = tracing_enabled() if enabled is None else enabled
+        self._lock = threading.Lock()
+        # Survive reset(): counter name -> HELP text, and series that start at 0
+        self._help = {}
+        self._declared = []
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # name -> {"count", "total_s", "max_s", "buckets"}
+            self._spans = {}
+            # (name, sorted label items) -> value
+            self._counters = {key: 0 for key in self._declared}
+
+    def declare(self, name, help_text, labels=None):
+        """
+        Registers a counter's HELP text and starts each label set in `labels`
+        (a list of dicts; None for an unlabelled counter) at 0.
+        """
+        with self._lock:
+            self._help[name] = help_text
+            for label_set in labels or [None]:
+                key = _series_key(name, label_set)
+                if key not in self._declared:
+                    self._declared.append(key)
+                self._counters.setdefault(key, 0)
+
+    # ---------- Recording ----------
+    def span(self, name):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name)
+
+    def record(self, name, seconds):
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = {"count": 0, "total_s": 0.0, "max_s": 0.0, "buckets": [0] * len(BUCKETS)}
+                self._spans[name] = stats
+            stats["count"] += 1
+            stats["total_s"] += seconds
+            stats["max_s"] = max(stats["max_s"], seconds)
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    stats["buckets"][i] += 1
+
+    def incr(self, name, value=1, labels=None):
+        if not self.enabled:
+            return
+        key = _series_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    # ---------- Reporting ----------
+    def breakdown(self):
+        """
+        One row per stage, slowest total first:
+        stage, calls, total_s, mean_ms, max_ms, share (fraction of all span time).
+        """
+        with self._lock:
+            spans = {name: dict(stats) for name, stats in self._spans.items()}
+
+        grand_total = sum(stats["total_s"] for stats in spans.values())
+        rows = []
+        for name, stats in sorted(spans.items(), key=lambda item: -item[1]["total_s"]):
+            rows.append({
+                "stage": name,
+                "calls": stats["count"],
+                "total_s": stats["total_s"],
+                "mean_ms": 1000.0 * stats["total_s"] / stats["count"],
+                "max_ms": 1000.0 * stats["max_s"],
+                "share": stats["total_s"] / grand_total if grand_total else 0.0,
+            })
+        return rows
+
+    def counters(self):
+        """Counter totals by name, summed over label sets."""
+        totals = {}
+        with self._lock:
+            for (name, _), value in self._counters.items():
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def render_prometheus(self, namespace="screening"):
+        """Prometheus text exposition (format 0.0.4) of all spans and counters."""
+        with self._lock:
+            spans = {name: (stats["count"], stats["total_s"], list(stats["buckets"]))
+                     for name, stats in self._spans.items()}
+            counters = dict(self._counters)
+            help_texts = dict(self._help)
+
+        metric = f"{namespace}_stage_duration_seconds"
+        lines = [
+            f"# HELP {metric} Time spent in each pipeline stage.",
+            f"# TYPE {metric} histogram",
+        ]
+        for name, (count, total, buckets) in sorted(spans.items()):
+            for bound, bucket_count in zip(BUCKETS, buckets):
+                lines.append(f'{metric}_bucket{{stage="{name}",le="{bound}"}} {bucket_count}')
+            lines.append(f'{metric}_bucket{{stage="{name}",le="+Inf"}} {count}')
+            lines.append(f'{metric}_sum{{stage="{name}"}} {total}')
+            lines.append(f'{metric}_count{{stage="{name}"}} {count}')
+
+        # One metric per counter name, one series per label set
+        series_by_name = {}
+        for (name, label_items), value in counters.items():
+            series_by_name.setdefault(name, []).append((label_items, value))
+
+        for name, series in sorted(series_by_name.items()):
+            counter = f"{namespace}_{_metric_name(name)}_total"
+            help_text = help_texts.get(name, f"Count of {name.replace('_', ' ')} events.")
+            lines.append(f"# HELP {counter} {help_text}")
+            lines.append(f"# TYPE {counter} counter")
+            for label_items, value in sorted(series):
+                lines.append(f"{counter}{_format_labels(label_items)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _series_key(name, labels):
+    return (name, tuple(sorted((labels or {}).items())))
+
+
+def _format_labels(label_items):
+    if not label_items:
+        return ""
+    pairs = ",".join(f'{_metric_name(key)}="{_escape_label(value)}"' for key, value in label_items)
+    return "{" + pairs + "}"
+
+
+def _escape_label(value):
+    # Exposition format escapes backslash, double quote and newline in label values
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _metric_name(name):
+    # Prometheus names allow [a-zA-Z0-9_:] only
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
@@ -20,7 +20,9 @@ if 'model' not in st.session_state:
         print(f"Error loading SentenceTransformer model: {e}")
         st.session_state.model = None
 
-model = st.session_state.model
+# .get() keeps the module importable outside `streamlit run` (e.g. benchmark.py),
+# where session state is always empty
+model = st.session_state.get('model')
 
 # ==========================================
 # 📄 Extract text from PDF/DOCX/TXT